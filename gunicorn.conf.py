@@ -0,0 +1,20 @@
+# Gunicorn settings for project3:app
+#   gunicorn -c gunicorn.conf.py project3:app
+import multiprocessing
+import os
+
+bind = "127.0.0.1:5000"
+
+# The routes mostly wait on MySQL, so gevent workers let many requests
+# overlap their DB I/O inside one process
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_connections = 200
+
+# Every worker has its own SQLAlchemy pool. project3.py divides DB_MAX_CONNECTIONS
+# (default 120, under MySQL's default max_connections of 151) by this worker count
+# to size each pool, so export it to the workers.
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# Each worker also has its own in-process response cache unless CACHE_REDIS_URL
+# points them at a shared Redis (see the cache setup in project3.py).